@@ -1,9 +1,69 @@
-from PyQt6.QtWidgets import *
-from PyQt6.QtCore import *
-from PyQt6.QtMultimedia import *
-from PyQt6.QtMultimediaWidgets import *
+import os
+import logging
 
-def openFile():
-    fileName, _ = QFileDialog.getOpenFileName(directory = QDir.homePath())
-    return fileName
+from PyQt6.QtWidgets import QFileDialog
+from PyQt6.QtCore import QDir, QObject, QRunnable, pyqtSignal
+from PyQt6.QtGui import QImage
 
+log = logging.getLogger(__name__)
+
+VIDEO_EXTENSIONS = ('.mp4', '.mkv', '.mov', '.webm', '.avi')
+
+# Reused between Browse clicks so Qt keeps its directory model instead of re-scanning
+_dialog = None
+
+def openFile(parent=None):
+    global _dialog
+    if _dialog is None:
+        _dialog = QFileDialog(parent, "Select video")
+        _dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        # Let the OS picker enumerate the directory instead of Qt's widget dialog
+        _dialog.setOption(QFileDialog.Option.DontUseNativeDialog, False)
+        _dialog.setOption(QFileDialog.Option.DontUseCustomDirectoryIcons, True)
+        _dialog.setOption(QFileDialog.Option.DontResolveSymlinks, True)
+        _dialog.setNameFilter("Videos (" + " ".join("*" + ext for ext in VIDEO_EXTENSIONS) + ")")
+        _dialog.setDirectory(QDir.homePath())
+
+    if not _dialog.exec():
+        return ""
+
+    # The dialog keeps its last directory, so the next Browse click reopens there
+    selected = _dialog.selectedFiles()
+    return selected[0] if selected else ""
+
+def isVideoFile(path):
+    return bool(path) and os.path.isfile(path) and path.lower().endswith(VIDEO_EXTENSIONS)
+
+def grabPosterFrame(path):
+    """Decode the first frame of a video with ffmpeg, returns a null QImage on failure"""
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ['ffmpeg', '-v', 'error', '-i', path, '-vframes', '1', '-f', 'image2pipe', '-vcodec', 'png', '-'],
+            capture_output=True,
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+        )
+    except OSError as e:
+        log.warning("Could not run ffmpeg for poster frame: %s", e)
+        return QImage()
+
+    image = QImage()
+    if result.returncode == 0:
+        image.loadFromData(result.stdout, "PNG")
+    return image
+
+
+class PosterSignals(QObject):
+    ready = pyqtSignal(str, QImage)
+
+
+class PosterLoader(QRunnable):
+    """Grabs a poster frame on a QThreadPool thread and hands it back to the GUI thread"""
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.signals = PosterSignals()
+
+    def run(self):
+        self.signals.ready.emit(self.path, grabPosterFrame(self.path))
@@ -1,29 +1,107 @@
 import os
-import subprocess
-from PyQt6.QtGui import QPainter, QColor, QShortcut, QKeySequence, QPen, QFont, QIcon
+import logging
+from collections import OrderedDict
+from functools import lru_cache
+
+# Must be set before QtMultimedia is first imported
+os.environ.setdefault("QT_MEDIA_BACKEND", "ffmpeg")
+
+from PyQt6.QtGui import QPainter, QColor, QPen, QIcon, QPixmap, QPixmapCache, QImage
 from PyQt6.QtWidgets import (
     QMainWindow, QApplication, QWidget, QLabel, QPushButton,
-    QGridLayout, QHBoxLayout, QVBoxLayout, QSlider, QCheckBox,
-    QLineEdit, QMessageBox, QDialog, QTextEdit
+    QGridLayout, QHBoxLayout, QVBoxLayout, QStackedLayout, QSizePolicy, QSlider, QCheckBox,
+    QLineEdit, QMessageBox
 )
-from PyQt6.QtCore import Qt, QSize, QUrl, QRect, QTimer
-from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
-from PyQt6.QtMultimediaWidgets import QVideoWidget
-from qt_material import apply_stylesheet
+from PyQt6.QtCore import Qt, QUrl, QRect, QTimer, QThread, QThreadPool, QSignalBlocker, pyqtSignal, pyqtSlot
 import sys
-import os
 
-from FrameMonkey.GUI.Functions import openFile
+from FrameMonkey.GUI.Functions import openFile, isVideoFile, PosterLoader
+from FrameMonkey.GUI.preview import PyAvPreview
+
+log = logging.getLogger(__name__)
+
+
+# Applied once to the QApplication in __main__ instead of per window
+_STYLE = """
+QMainWindow, QWidget {
+    background-color: #343434;
+    color: white;
+}
+QPushButton {
+    background-color: #FFD700;
+    color: black;
+    padding: 5px;
+    border-radius: 3px;
+    min-width: 60px;
+}
+QPushButton#compressBtn {
+    background-color: #FF4444;
+    color: white;
+    font-weight: bold;
+}
+QPushButton#frameBtn {
+    background-color: #FFD700;
+    color: black;
+    font-weight: bold;
+    max-width: 40px;
+    padding: 2px;
+}
+QLabel {
+    color: white;
+    margin-right: 5px;
+}
+QLineEdit {
+    max-width: 60px;
+    background-color: #444444;
+    color: white;
+    padding: 3px;
+    border: 1px solid #555555;
+}
+QSlider {
+    background-color: transparent;
+}
+QCheckBox {
+    color: white;
+    spacing: 5px;
+}
+QCheckBox::indicator {
+    width: 15px;
+    height: 15px;
+    background-color: #444444;
+    border: 1px solid #555555;
+}
+QCheckBox::indicator:checked {
+    background-color: #FFD700;
+}
+"""
 
 
 class MainWindow(QMainWindow):
+    # Carries (path, ms, width, height) to the preview decoder on its worker thread
+    previewRequested = pyqtSignal(str, int, int, int)
+    previewCloseRequested = pyqtSignal()
+
+    # Display-sized poster frames keyed by (path, mtime), oldest evicted first once over budget
+    _posterCache = OrderedDict()
+    _posterCacheBytes = 32 * 1024 * 1024
+
+    # (attribute, label, tooltip, checked by default) for each encoding option
+    _CHECKBOXES = (
+        ("trimVideo", "Trim", "Enable video trimming", False),
+        ("twoPass", "Two Pass", "Enable two-pass encoding for better quality", False),
+        ("hwAccel", "HW Accel", "Enable hardware acceleration for faster encoding", True),
+    )
+
     def __init__(self, inputFile=None):
         super().__init__()
-        # self.setFixedSize(QSize(1920, 1080))
+        # Size relative to the screen instead of a fixed 1920x1080 backing store
+        screen = QApplication.primaryScreen().availableGeometry()
+        self.resize(int(screen.width() * 0.75), int(screen.height() * 0.75))
+        self.setMinimumSize(550, 570)
         self.setWindowTitle("FrameMonkey")
 
-        # Set window icon
-        icon_path = r"C:\!Dev\FrameMonkey\FrameMonkey\GUI\Assets\FrameMonkey_Icon_Transparent.png"
+        # Set window icon from the Assets folder next to this file
+        icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Assets", "FrameMonkey_Icon_Transparent.png")
         self.setWindowIcon(QIcon(icon_path))
 
         # Create all buttons first
@@ -46,64 +124,15 @@ class MainWindow(QMainWindow):
         self.compressBtn.clicked.connect(self.executeCompression)
         browseFileBtn.clicked.connect(self.handleFileOpen)
 
-        # Set the stylesheet
-        self.setStyleSheet("""
-            QMainWindow, QWidget {
-                background-color: #343434;
-                color: white;
-            }
-            QPushButton {
-                background-color: #FFD700;
-                color: black;
-                padding: 5px;
-                border-radius: 3px;
-                min-width: 60px;
-            }
-            QPushButton#compressBtn {
-                background-color: #FF4444;
-                color: white;
-                font-weight: bold;
-            }
-            QPushButton#frameBtn {
-                background-color: #FFD700;
-                color: black;
-                font-weight: bold;
-                max-width: 40px;
-                padding: 2px;
-            }
-            QLabel {
-                color: white;
-                margin-right: 5px;
-            }
-            QLineEdit {
-                max-width: 60px;
-                background-color: #444444;
-                color: white;
-                padding: 3px;
-                border: 1px solid #555555;
-            }
-            QSlider {
-                background-color: transparent;
-            }
-            QCheckBox {
-                color: white;
-                spacing: 5px;
-            }
-            QCheckBox::indicator {
-                width: 15px;
-                height: 15px;
-                background-color: #444444;
-                border: 1px solid #555555;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #FFD700;
-            }
-        """)
-
-        # Create a central widget and main layout
+        # Buttons stay out of the focus chain so arrows and space reach keyPressEvent
+        for btn in [self.prevFrameBtn, self.playButton, self.nextFrameBtn, self.compressBtn, browseFileBtn]:
+            btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+
+        # Build the whole widget tree off-screen, then attach it to the window in one go
+        self.setAttribute(Qt.WidgetAttribute.WA_DontCreateNativeAncestors)
         self.central_widget = QWidget()
-        self.setCentralWidget(self.central_widget)
-        layout = QGridLayout(self.central_widget)
+        self.central_widget.setUpdatesEnabled(False)
+        layout = QGridLayout()
 
         # Input File Component
         fileControlLayout = QHBoxLayout()
@@ -111,43 +140,51 @@ class MainWindow(QMainWindow):
         fileControlLayout.addWidget(self.fileNameLabel)
         fileControlLayout.addWidget(browseFileBtn)
 
-        # Video Player Component - with error handling
-        try:
-            # Create video widget first
-            self.videoWidget = QVideoWidget()
-            self.videoWidget.setMinimumSize(960, 540)
-
-            # Create media player with audio output
-            try:
-                self.player = QMediaPlayer()
-                self.audioOutput = QAudioOutput()
-                self.player.setAudioOutput(self.audioOutput)
-                print("QMediaPlayer and QVideoWidget initialized successfully")
-            except Exception as e:
-                print(f"Error initializing media player: {e}")
-
-            # Set video output
-            self.player.setVideoOutput(self.videoWidget)
-            self.videoWidget.setAspectRatioMode(Qt.AspectRatioMode.KeepAspectRatio)
-
-        except Exception as e:
-            print(f"Error initializing media player: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Failed to initialize media player components: {str(e)}")
-            return
-
-        # Create a widget for file controls
-        fileControlWidget = QWidget()
-        fileControlWidget.setLayout(fileControlLayout)
-        fileControlWidget.setMaximumHeight(50)
-
-        # Layout adjustments for more video space
-        layout.setRowStretch(1, 4)
-        layout.addWidget(fileControlWidget, 0, 0, 1, 7)
-        layout.addWidget(self.videoWidget, 1, 0, 6, 7)
+        # Video Player Component - QtMultimedia is only loaded once a video is opened
+        self.player = None
+        self.videoWidget = None
+        self.videoContainer = QWidget()
+        self.videoContainer.setMinimumSize(480, 270)
+        self.videoContainer.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.videoLayout = QStackedLayout(self.videoContainer)
+        self.videoLayout.setContentsMargins(0, 0, 0, 0)
+
+        # Poster frame shown at index 0 until the player has loaded the media
+        self.posterLabel = QLabel()
+        self.posterLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # Ignore the pixmap's size hint, otherwise a poster pins the window's minimum size
+        self.posterLabel.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
+        self.videoLayout.addWidget(self.posterLabel)
+
+        # Control rows are added as plain layouts, without wrapper widgets, and keep the
+        # grid's default row stretch of 0 so only the video row grows
+        layout.addLayout(fileControlLayout, 0, 0, 1, 7)
+        layout.addWidget(self.videoContainer, 1, 0, 6, 7)
 
         # Add dual slider
         self.dualSlider = DualSlider()
         self.dualSlider.slider.valueChanged.connect(self.handleSliderValueChanged)
+
+        # Frame-accurate trim previews are decoded directly instead of seeking the player,
+        # on a worker thread so marker drags never wait on the decoder
+        self.preview = PyAvPreview()
+        self._previewThread = QThread(self)
+        self.preview.moveToThread(self._previewThread)
+        self.previewRequested.connect(self.preview.requestFrame)
+        self.previewCloseRequested.connect(self.preview.close)
+        self.preview.frameReady.connect(self.showPreviewFrame)
+        self._previewThread.start()
+
+        # Only the latest marker position is decoded, at most one request is in flight
+        self._previewActive = False
+        self._previewBusy = False
+        self._pendingPreviewMs = None
+        self._previewTimer = QTimer(self)
+        self._previewTimer.setSingleShot(True)
+        self._previewTimer.setInterval(50)
+        self._previewTimer.timeout.connect(self._flushPreview)
+        self.dualSlider.trimMarkerMoved.connect(self.previewTrimFrame)
+        self.dualSlider.trimDragFinished.connect(self.endTrimPreview)
         layout.addWidget(self.dualSlider, 7, 0, 1, 7)
 
         # Add frame control buttons with reduced height
@@ -165,53 +202,28 @@ class MainWindow(QMainWindow):
         frameControlLayout.addStretch()
 
         # Frame controls
-        frameControlWidget = QWidget()
-        frameControlWidget.setLayout(frameControlLayout)
-        frameControlWidget.setMaximumHeight(40)
-        layout.addWidget(frameControlWidget, 8, 0, 1, 7)
+        layout.addLayout(frameControlLayout, 8, 0, 1, 7)
 
         # Checkbox layout with shorter labels
         checkboxLayout = QHBoxLayout()
         checkboxLayout.setSpacing(20)  # Space between checkbox groups
 
-        # Create horizontal layouts for each checkbox+label pair
-        trimLayout = QHBoxLayout()
-        trimLayout.setSpacing(2)
-        self.trimVideo = QCheckBox()
-        trimVideoLabel = QLabel("Trim")
-        trimLayout.addWidget(self.trimVideo)
-        trimLayout.addWidget(trimVideoLabel)
-
-        twoPassLayout = QHBoxLayout()
-        twoPassLayout.setSpacing(2)
-        self.twoPass = QCheckBox()
-        twoPassLabel = QLabel("Two Pass")
-        twoPassLayout.addWidget(self.twoPass)
-        twoPassLayout.addWidget(twoPassLabel)
-
-        hwAccelLayout = QHBoxLayout()
-        hwAccelLayout.setSpacing(2)
-        self.hwAccel = QCheckBox()
-        self.hwAccel.setChecked(True)
-        hwAccelLabel = QLabel("HW Accel")
-        hwAccelLayout.addWidget(self.hwAccel)
-        hwAccelLayout.addWidget(hwAccelLabel)
-
-        # Add tooltips
-        self.trimVideo.setToolTip("Enable video trimming")
-        self.twoPass.setToolTip("Enable two-pass encoding for better quality")
-        self.hwAccel.setToolTip("Enable hardware acceleration for faster encoding")
-
-        # Add each pair to the main layout
-        checkboxLayout.addLayout(trimLayout)
-        checkboxLayout.addLayout(twoPassLayout)
-        checkboxLayout.addLayout(hwAccelLayout)
+        # Create a horizontal checkbox+label pair for each option and add it to the main layout
+        for attrName, labelText, toolTip, checked in self._CHECKBOXES:
+            pairLayout = QHBoxLayout()
+            pairLayout.setSpacing(2)
+            checkbox = QCheckBox()
+            checkbox.setChecked(checked)
+            checkbox.setToolTip(toolTip)
+            checkbox.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+            pairLayout.addWidget(checkbox)
+            pairLayout.addWidget(QLabel(labelText))
+            checkboxLayout.addLayout(pairLayout)
+            setattr(self, attrName, checkbox)
+
         checkboxLayout.addStretch()
 
-        checkboxWidget = QWidget()
-        checkboxWidget.setLayout(checkboxLayout)
-        checkboxWidget.setMaximumHeight(40)
-        layout.addWidget(checkboxWidget, 9, 0, 1, 7)
+        layout.addLayout(checkboxLayout, 9, 0, 1, 7)
 
         # Quality settings
         qualityLayout = QHBoxLayout()
@@ -240,82 +252,142 @@ class MainWindow(QMainWindow):
         qualityLayout.addLayout(qualityInputLayout)
         qualityLayout.addStretch()
 
-        qualityWidget = QWidget()
-        qualityWidget.setLayout(qualityLayout)
-        qualityWidget.setMaximumHeight(40)
-        layout.addWidget(qualityWidget, 10, 0, 1, 7)
+        layout.addLayout(qualityLayout, 10, 0, 1, 7)
 
         # Add compress button at the bottom
         self.compressBtn.setMaximumHeight(40)
         self.compressBtn.setMinimumWidth(100)
         layout.addWidget(self.compressBtn, 11, 0, 1, 7)
 
+        # Declare stretch and spacing once, after every cell is populated, for more video space
+        layout.setColumnStretch(0, 1)
+        layout.setRowStretch(1, 4)
+        layout.setContentsMargins(4, 4, 4, 4)
+        layout.setSpacing(2)
+
+        self.central_widget.setLayout(layout)
+        self.central_widget.setUpdatesEnabled(True)
+        self.setCentralWidget(self.central_widget)
+
+        # Throttle for playback position updates, see updatePosition
+        self._pendingPos = 0
+        self._posTimer = QTimer(self)
+        self._posTimer.setSingleShot(True)
+        self._posTimer.setInterval(33)
+        self._posTimer.timeout.connect(self._flushPosition)
+
+        # Keyboard controls: arrows step frames, space toggles playback
+        self._keymap = {
+            Qt.Key.Key_Left.value: self.previousFrame,
+            Qt.Key.Key_Right.value: self.nextFrame,
+            Qt.Key.Key_Space.value: self.togglePlayback,
+        }
+
+        # Load the input file only if it is an actual video, so the media stack stays idle otherwise
+        if isVideoFile(inputFile):
+            try:
+                self.loadVideo(inputFile)
+            except Exception as e:
+                log.warning("Error loading input file: %s", e)
+
+    def _ensure_player(self):
+        """Create the media player and video widget on first use"""
+        if self.player is not None:
+            return True
+
+        # Qt reads the decoder device list once per process, so only skip the probe when HW accel is off
+        if not self.hwAccel.isChecked():
+            os.environ.setdefault("QT_FFMPEG_DECODING_HW_DEVICE_TYPES", "")
+
+        try:
+            from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
+            from PyQt6.QtMultimediaWidgets import QVideoWidget
+
+            # Create video widget first
+            self.videoWidget = QVideoWidget()
+            self.videoWidget.setAspectRatioMode(Qt.AspectRatioMode.KeepAspectRatio)
+            # The video surface covers the whole widget, so skip background fills on repaint
+            self.videoWidget.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+            self.videoWidget.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+            QPixmapCache.setCacheLimit(16 * 1024)
+            self.videoLayout.addWidget(self.videoWidget)
+
+            # Create media player with audio output
+            self.player = QMediaPlayer()
+            self.audioOutput = QAudioOutput()
+            self.player.setAudioOutput(self.audioOutput)
+            self.player.setVideoOutput(self.videoWidget)
+            log.debug("QMediaPlayer and QVideoWidget initialized successfully")
+
+        except Exception as e:
+            log.error("Error initializing media player: %s", e)
+            QMessageBox.critical(self, "Error", f"Failed to initialize media player components: {str(e)}")
+            self.player = None
+            return False
+
         # Connect media player signals
         try:
             self.player.positionChanged.connect(self.updatePosition)
             self.player.durationChanged.connect(self.updateDuration)
             self.player.errorOccurred.connect(self.handleError)
+            self.player.mediaStatusChanged.connect(self.handleMediaStatus)
         except Exception as e:
-            print(f"Error connecting media player signals: {e}")
+            log.warning("Error connecting media player signals: %s", e)
             QMessageBox.warning(self, "Warning", "Some media player features may not be available")
 
-        # Set up keyboard shortcuts
-        self.setupShortcuts()
-
         # Set default audio volume
         self.audioOutput.setVolume(1.0)
+        return True
 
-        # Load the input file if provided and it exists
-        if inputFile and os.path.isfile(inputFile):
-            self.fileNameLabel.setText(inputFile)
-            try:
-                self.player.setSource(QUrl.fromLocalFile(inputFile))
-                self.player.play()
-            except Exception as e:
-                print(f"Error loading input file: {e}")
-
-    def setupShortcuts(self):
-        # Left arrow for previous frame
-        prevFrameShortcut = QShortcut(QKeySequence(Qt.Key.Key_Left), self)
-        prevFrameShortcut.activated.connect(self.previousFrame)
-
-        # Right arrow for next frame
-        nextFrameShortcut = QShortcut(QKeySequence(Qt.Key.Key_Right), self)
-        nextFrameShortcut.activated.connect(self.nextFrame)
-
-        # Space for play/pause
-        playPauseShortcut = QShortcut(QKeySequence(Qt.Key.Key_Space), self)
-        playPauseShortcut.activated.connect(self.togglePlayback)
+    def keyPressEvent(self, event):
+        handler = self._keymap.get(event.key())
+        if handler:
+            handler()
+        else:
+            super().keyPressEvent(event)
 
+    @pyqtSlot()
     def previousFrame(self):
-        if hasattr(self, 'frameTime') and self.player.duration() > 0:
+        if self.player is not None and hasattr(self, 'frameTime') and self.player.duration() > 0:
             currentPos = self.player.position()
             newPos = max(0, currentPos - int(self.frameTime))
             self.player.pause()  # Pause when stepping frames
             self.player.setPosition(newPos)
             self.playButton.setText("⏯")
 
+    @pyqtSlot()
     def nextFrame(self):
-        if hasattr(self, 'frameTime') and self.player.duration() > 0:
+        if self.player is not None and hasattr(self, 'frameTime') and self.player.duration() > 0:
             currentPos = self.player.position()
             newPos = min(self.player.duration(), currentPos + int(self.frameTime))
             self.player.pause()  # Pause when stepping frames
             self.player.setPosition(newPos)
             self.playButton.setText("⏯")
 
+    @pyqtSlot('qint64')
     def updatePosition(self, position):
+        # Coalesce bursts of positionChanged into one slider refresh per ~30 Hz tick
+        self._pendingPos = position
+        if not self._posTimer.isActive():
+            self._posTimer.start()
+
+    @pyqtSlot()
+    def _flushPosition(self):
         # Update slider position
         if self.player.duration() > 0:
-            sliderValue = int((position * 1000) / self.player.duration())
+            sliderValue = int((self._pendingPos * 1000) / self.player.duration())
+            # Nothing to redraw until playback crosses into the next of the 1000 slider steps
+            if sliderValue == self.dualSlider.currentPos:
+                return
             # Block signals temporarily to prevent feedback loop
-            self.dualSlider.slider.blockSignals(True)
-            self.dualSlider.slider.setValue(sliderValue)
-            self.dualSlider.slider.blockSignals(False)
+            with QSignalBlocker(self.dualSlider.slider):
+                self.dualSlider.slider.setValue(sliderValue)
             # Update current position in dual slider
             self.dualSlider.currentPos = sliderValue
-            self.dualSlider.updateTimeLabels()
-            self.dualSlider.update()
+            self.dualSlider.scheduleTimeLabels()
+            self.dualSlider.updateMarkers()
 
+    @pyqtSlot('qint64')
     def updateDuration(self, duration):
         self.dualSlider.setDuration(duration / 1000)  # Convert to seconds
         # Set a default frame time of 1/30th of a second if we can't get the actual frame rate
@@ -329,16 +401,144 @@ class MainWindow(QMainWindow):
                 if frameRate > 0:
                     self.frameTime = 1000 / frameRate  # Frame duration in milliseconds
         except Exception as e:
-            print(f"Could not get frame rate, using default 30fps: {e}")
+            log.debug("Could not get frame rate, using default 30fps: %s", e)
 
+    @pyqtSlot()
     def handleFileOpen(self):
-        fileName = openFile()
+        fileName = openFile(self)
         if fileName:
-            self.fileNameLabel.setText(fileName)
-            self.player.setSource(QUrl.fromLocalFile(fileName))
+            self.loadVideo(fileName)
+
+    def loadVideo(self, fileName):
+        if not self._ensure_player():
+            return
+        self.fileNameLabel.setText(fileName)
+
+        # Reselecting the loaded file just rewinds the existing pipeline
+        if self.player.source().toLocalFile() == QUrl.fromLocalFile(fileName).toLocalFile():
+            self.player.setPosition(0)
             self.player.play()
+            return
+
+        # Show a poster frame while the player opens the file
+        self.posterLabel.clear()
+        self.videoLayout.setCurrentWidget(self.posterLabel)
+        cached = self._getCachedPoster(fileName)
+        if cached is not None:
+            self.setPosterPixmap(cached)
+        else:
+            poster = PosterLoader(fileName)
+            poster.signals.ready.connect(self.showPoster)
+            QThreadPool.globalInstance().start(poster)
 
+        self.player.setSource(QUrl.fromLocalFile(fileName))
+        self.player.play()
+
+    @pyqtSlot(str, QImage)
+    def showPoster(self, fileName, image):
+        if image.isNull():
+            return
+        # Keep at most display resolution, a full-size 4K frame would be ~33 MB per cache entry
+        size = self.posterLabel.contentsRect().size()
+        if not size.isEmpty() and (image.width() > size.width() or image.height() > size.height()):
+            image = image.scaled(size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        pixmap = QPixmap.fromImage(image)
+        self._cachePoster(fileName, pixmap)
+        # Ignore stale posters from a previously selected file
+        if fileName == self.fileNameLabel.text():
+            self.setPosterPixmap(pixmap)
+
+    def setPosterPixmap(self, pixmap):
+        if self.videoLayout.currentWidget() is not self.posterLabel:
+            return
+        size = self.posterLabel.contentsRect().size()
+        # Frames already fitted to this area (PyAV preview, cached posters) are shown as-is,
+        # allowing a pixel of slack for the decoder's integer rounding
+        fits = pixmap.width() <= size.width() and pixmap.height() <= size.height()
+        if not (fits and (size.width() - pixmap.width() <= 1 or size.height() - pixmap.height() <= 1)):
+            pixmap = pixmap.scaled(size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        self.posterLabel.setPixmap(pixmap)
+
+    def _posterKey(self, fileName):
+        try:
+            return (fileName, os.path.getmtime(fileName))
+        except OSError:
+            return None
+
+    def _getCachedPoster(self, fileName):
+        key = self._posterKey(fileName)
+        if key not in self._posterCache:
+            return None
+        self._posterCache.move_to_end(key)
+        return self._posterCache[key]
+
+    def _cachePoster(self, fileName, pixmap):
+        key = self._posterKey(fileName)
+        if key is None:
+            return
+        self._posterCache[key] = pixmap
+        self._posterCache.move_to_end(key)
+        # Always keep the newest entry, even if it alone exceeds the budget
+        while len(self._posterCache) > 1 and self._posterCacheUsage() > self._posterCacheBytes:
+            self._posterCache.popitem(last=False)
+
+    def _posterCacheUsage(self):
+        return sum(p.width() * p.height() * p.depth() // 8 for p in self._posterCache.values())
+
+    @pyqtSlot(float)
+    def previewTrimFrame(self, seconds):
+        if self.player is None:
+            return
+        self._previewActive = True
+        self._pendingPreviewMs = int(seconds * 1000)
+        if not self._previewTimer.isActive():
+            self._previewTimer.start()
+
+    @pyqtSlot()
+    def _flushPreview(self):
+        # A busy decoder picks up the pending position when its current frame arrives
+        if self._previewBusy or self._pendingPreviewMs is None:
+            return
+        ms, self._pendingPreviewMs = self._pendingPreviewMs, None
+        self._previewBusy = True
+        size = self.posterLabel.contentsRect().size()
+        self.previewRequested.emit(self.fileNameLabel.text(), ms, size.width(), size.height())
+
+    @pyqtSlot(QImage)
+    def showPreviewFrame(self, image):
+        self._previewBusy = False
+        # Frames that finish decoding after the drag has ended are dropped
+        if self._previewActive and not image.isNull():
+            self.videoLayout.setCurrentWidget(self.posterLabel)
+            self.setPosterPixmap(QPixmap.fromImage(image))
+        self._flushPreview()
+
+    @pyqtSlot()
+    def endTrimPreview(self):
+        self._previewActive = False
+        self._pendingPreviewMs = None
+        if self.videoWidget is not None and self.videoLayout.currentWidget() is self.posterLabel:
+            self.videoLayout.setCurrentWidget(self.videoWidget)
+            self.posterLabel.clear()
+
+    def closeEvent(self, event):
+        # Queued ahead of quit, so the container is closed on the thread that owns it
+        self.previewCloseRequested.emit()
+        self._previewThread.quit()
+        self._previewThread.wait()
+        super().closeEvent(event)
+
+    def handleMediaStatus(self, status):
+        from PyQt6.QtMultimedia import QMediaPlayer
+        if status == QMediaPlayer.MediaStatus.LoadedMedia:
+            self.videoLayout.setCurrentWidget(self.videoWidget)
+            self.posterLabel.clear()
+
+    @pyqtSlot()
     def togglePlayback(self):
+        if self.player is None:
+            return
+        from PyQt6.QtMultimedia import QMediaPlayer
         if self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
             self.player.pause()
             self.playButton.setText("⏯")
@@ -347,11 +547,13 @@ class MainWindow(QMainWindow):
             self.playButton.setText("⏸")
 
     def handleError(self, error, errorString):
+        from PyQt6.QtMultimedia import QMediaPlayer
         if error != QMediaPlayer.Error.NoError:
             QMessageBox.warning(self, "Media Error", f"Error playing media: {errorString}")
 
+    @pyqtSlot(int)
     def handleSliderValueChanged(self, value):
-        if self.player.duration() > 0:
+        if self.player is not None and self.player.duration() > 0:
             # Convert slider value (0-1000) to video position
             newPosition = int((value * self.player.duration()) / 1000)
             self.player.setPosition(newPosition)
@@ -360,7 +562,10 @@ class MainWindow(QMainWindow):
         """Return the start and end trim times in seconds"""
         return (self.dualSlider.getStartTime(), self.dualSlider.getEndTime())
 
+    @pyqtSlot()
     def executeCompression(self):
+        import subprocess
+
         startTime, endTime = self.getTrimTimes()
         inputFile = self.fileNameLabel.text()
         targetSize = int(self.fileSize.text())
@@ -376,37 +581,38 @@ class MainWindow(QMainWindow):
             ms = int((seconds % 1) * 1000)
             return f"{hours:02d}:{minutes:02d}:{secs:02d}.{ms:03d}"
 
-        # Build the script arguments
-        script_args = f'-inputFile "{inputFile}" -targetSizeMB {targetSize}'
+        # Build the script arguments, subprocess takes care of quoting each one
+        script_args = ['-inputFile', inputFile, '-targetSizeMB', str(targetSize)]
 
         # Add trim parameters if trim video is checked
         if self.trimVideo.isChecked():
             formatted_start = format_time(startTime)
             formatted_end = format_time(endTime)
-            script_args += f' -TrimStart "{formatted_start}" -TrimEnd "{formatted_end}"'
+            script_args += ['-TrimStart', formatted_start, '-TrimEnd', formatted_end]
 
         # Add two-pass parameter if checked
         if twoPass:
-            script_args += ' -twoPass'
+            script_args.append('-twoPass')
 
         # Add hardware acceleration parameter if checked
         if hwAccel:
-            script_args += ' -hwAccel'
+            script_args.append('-hwAccel')
 
-        # Construct the PowerShell command
+        # Construct the PowerShell command, -NoExit has to come before -File
         ps_command = [
             'powershell',
             '-ExecutionPolicy', 'Bypass',
             '-NoProfile',
             '-NoExit',
-            '-Command',
-            f'cd "{frameMonkey_directory}"; Write-Host "Starting compression..."; ./compress_video.ps1 {script_args}'
+            '-File', os.path.join(frameMonkey_directory, 'compress_video.ps1'),
+            *script_args
         ]
 
         try:
             # Create process with new window
             process = subprocess.Popen(
                 ps_command,
+                cwd=frameMonkey_directory,
                 creationflags=subprocess.CREATE_NEW_CONSOLE
             )
 
@@ -420,47 +626,31 @@ class MainWindow(QMainWindow):
                                 f"Error type: {type(e)}\n"
                                 f"Error message: {str(e)}")
 
-        # Print the command for debugging
-        print("Executing command:", ' '.join(ps_command))
-    def update_output(self, process):
-        # Read from stdout
-        output = process.stdout.readline()
-        if output:
-            self.outputText.append(output.strip())
-            self.outputText.verticalScrollBar().setValue(
-                self.outputText.verticalScrollBar().maximum()
-            )
+        # Log the command for debugging
+        log.debug("Executing command: %s", ' '.join(ps_command))
+
+
+@lru_cache(maxsize=4096)
+def formatSeconds(seconds):
+    """Format whole seconds as HH:MM:SS"""
+    return "%02d:%02d:%02d" % (seconds // 3600, seconds % 3600 // 60, seconds % 60)
 
-        # Read from stderr
-        error = process.stderr.readline()
-        if error:
-            self.outputText.append(f'<span style="color: red">{error.strip()}</span>')
-            self.outputText.verticalScrollBar().setValue(
-                self.outputText.verticalScrollBar().maximum()
-            )
 
-        # Check if process has finished
-        if process.poll() is not None:
-            self.timer.stop()
-            if process.returncode == 0:
-                self.outputText.append('<span style="color: green">Compression completed successfully!</span>')
-            else:
-                self.outputText.append('<span style="color: red">Compression failed with error code: '
-                                       f'{process.returncode}</span>')
-
-            # Clean up handles
-            process.stdout.close()
-            process.stderr.close()
 class DualSlider(QWidget):
+    # Emitted with the dragged trim marker's time in seconds, and when the drag ends
+    trimMarkerMoved = pyqtSignal(float)
+    trimDragFinished = pyqtSignal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.layout = QVBoxLayout(self)
-        self.setMouseTracking(True)
 
         # Create the main slider
         self.slider = QSlider(Qt.Orientation.Horizontal)
         self.slider.setMinimum(0)
         self.slider.setMaximum(1000)
+        # Arrow keys step frames through the main window rather than nudging the slider
+        self.slider.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         # Install event filter on slider
         self.slider.installEventFilter(self)
 
@@ -477,6 +667,20 @@ class DualSlider(QWidget):
         self.marker_width = 8
         self.hit_area = 15
 
+        # Paint resources reused on every repaint
+        self._rangeColor = QColor(255, 255, 0, 100)
+        self._blackColor = QColor(0, 0, 0)
+        self._blackPen = QPen(self._blackColor)
+        self._blackPen.setWidth(1)
+
+        # Whole-second (current, start, end) values currently shown in the time labels
+        self._lastLabelKey = None
+
+        # Marker x positions as of the last invalidation, used to repaint only what moved
+        self._lastStartX = None
+        self._lastEndX = None
+        self._lastCurrentX = None
+
         # Create time labels
         self.timeLayout = QHBoxLayout()
         self.currentTimeLabel = QLabel("00:00:00")
@@ -491,6 +695,13 @@ class DualSlider(QWidget):
 
         self.layout.addLayout(self.timeLayout)
         self.layout.addWidget(self.slider)
+        self._sliderWidth = self.slider.width()  # Kept current by resizeEvent
+
+        # Coalesce playback-driven label refreshes to at most 10 per second
+        self._labelTimer = QTimer(self)
+        self._labelTimer.setSingleShot(True)
+        self._labelTimer.setInterval(100)
+        self._labelTimer.timeout.connect(self.updateTimeLabels)
 
         # Connect signals
         self.slider.valueChanged.connect(self.handleSliderValueChanged)
@@ -499,7 +710,7 @@ class DualSlider(QWidget):
         if obj is self.slider:
             if event.type() == event.Type.MouseButtonPress and event.button() == Qt.MouseButton.LeftButton:
                 pos = event.position().x()
-                width = self.slider.width()
+                width = self._sliderWidth
 
                 # Calculate marker positions
                 startPixels = int(self.startPos * width / 1000)
@@ -508,11 +719,11 @@ class DualSlider(QWidget):
                 # Check for marker hits
                 if abs(pos - startPixels) < self.hit_area:
                     self.isDraggingStart = True
-                    print("Start marker hit")
+                    log.debug("Start marker hit")
                     return True  # Event handled
                 elif abs(pos - endPixels) < self.hit_area:
                     self.isDraggingEnd = True
-                    print("End marker hit")
+                    log.debug("End marker hit")
                     return True  # Event handled
                 #NEW: Handles clicks on empty slider area and teleports the slider there right away
                 else:
@@ -523,7 +734,7 @@ class DualSlider(QWidget):
             elif event.type() == event.Type.MouseMove:
                 if self.isDraggingStart or self.isDraggingEnd:
                     pos = event.position().x()
-                    width = self.slider.width()
+                    width = self._sliderWidth
                     relativePos = max(0, min(1000, int((pos * 1000) / width)))
 
                     if self.isDraggingStart:
@@ -532,36 +743,46 @@ class DualSlider(QWidget):
                         self.endPos = max(self.startPos + 10, relativePos)
 
                     self.updateTimeLabels()
-                    self.update()
+                    self.updateMarkers()
+                    self.trimMarkerMoved.emit(self.getStartTime() if self.isDraggingStart else self.getEndTime())
                     return True  # Event handled
 
             elif event.type() == event.Type.MouseButtonRelease:
+                if self.isDraggingStart or self.isDraggingEnd:
+                    self.trimDragFinished.emit()
                 self.isDraggingStart = False
                 self.isDraggingEnd = False
                 return True
 
         return super().eventFilter(obj, event)  # Pass unhandled events
 
+    def resizeEvent(self, event):
+        # The layout has already resized the slider by the time this runs
+        self._sliderWidth = self.slider.width()
+        # Qt repaints everything on resize, positions tracked for the old geometry no longer apply
+        self._lastStartX = self._lastEndX = self._lastCurrentX = None
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Get slider rectangle
+        # Get slider rectangle once and scale marker positions from it
         sliderRect = self.slider.geometry()
+        sx, y, sw, height = sliderRect.x(), sliderRect.y(), sliderRect.width(), sliderRect.height()
+        scale = sw / 1000.0
 
         # Draw the selection range
-        start_x = int(sliderRect.x() + (sliderRect.width() * self.startPos / 1000))
-        end_x = int(sliderRect.x() + (sliderRect.width() * self.endPos / 1000))
-        y = int(sliderRect.y())
-        height = int(sliderRect.height())
+        start_x = sx + int(self.startPos * scale)
+        end_x = sx + int(self.endPos * scale)
         range_width = end_x - start_x
 
         # Draw yellow range rectangle
         range_rect = QRect(start_x, y, range_width, height)
-        painter.fillRect(range_rect, QColor(255, 255, 0, 100))
+        painter.fillRect(range_rect, self._rangeColor)
 
         # Draw current position indicator
-        current_x = int(sliderRect.x() + (sliderRect.width() * self.currentPos / 1000))
+        current_x = sx + int(self.currentPos * scale)
         current_width = 4
         current_marker = QRect(
             current_x - current_width // 2,
@@ -569,7 +790,7 @@ class DualSlider(QWidget):
             current_width,
             height
         )
-        painter.fillRect(current_marker, QColor(0, 0, 0))
+        painter.fillRect(current_marker, self._blackColor)
 
         # Draw start and end markers
         markerWidth = self.marker_width
@@ -594,37 +815,64 @@ class DualSlider(QWidget):
         painter.fillRect(end_marker, end_color)
 
         # Draw borders for better visibility
-        pen = QPen(QColor(0, 0, 0))
-        pen.setWidth(1)
-        painter.setPen(pen)
+        painter.setPen(self._blackPen)
         painter.drawRect(start_marker)
         painter.drawRect(end_marker)
 
+    @pyqtSlot(int)
     def handleSliderValueChanged(self, value):
         self.currentPos = value
         self.updateTimeLabels()
-        self.update()
+        self.updateMarkers()
+
+    def updateMarkers(self):
+        """Repaint only the strips between each marker's last invalidated and current position"""
+        sliderRect = self.slider.geometry()
+        sx, scale = sliderRect.x(), sliderRect.width() / 1000.0
+        xs = (sx + int(self.startPos * scale), sx + int(self.endPos * scale), sx + int(self.currentPos * scale))
+        lastXs = (self._lastStartX, self._lastEndX, self._lastCurrentX)
+        self._lastStartX, self._lastEndX, self._lastCurrentX = xs
+
+        if None in lastXs:
+            self.update()
+            return
+
+        dirty = QRect()
+        for lastX, x in zip(lastXs, xs):
+            if x != lastX:
+                left = min(x, lastX) - self.marker_width
+                width = abs(x - lastX) + 2 * self.marker_width
+                dirty = dirty.united(QRect(left, sliderRect.y(), width, sliderRect.height()))
+
+        if not dirty.isNull():
+            # The 1px antialiased marker borders reach one row above and below the slider rect
+            pen = self._blackPen.width()
+            self.update(dirty.adjusted(0, -pen, 0, pen))
 
     def setDuration(self, duration):
         self.duration = duration
         self.endPos = 1000
         self.updateTimeLabels()
+        self.updateMarkers()
 
     def updateTimeLabels(self):
         if self.duration > 0:
-            current = self.currentPos * self.duration / 1000
-            start = self.startPos * self.duration / 1000
-            end = self.endPos * self.duration / 1000
-
-            self.currentTimeLabel.setText(self.formatTime(current))
-            self.startTimeLabel.setText(self.formatTime(start))
-            self.endTimeLabel.setText(self.formatTime(end))
-
-    def formatTime(self, seconds):
-        hours = int(seconds / 3600)
-        minutes = int((seconds % 3600) / 60)
-        secs = int(seconds % 60)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+            # Labels only show whole seconds, so skip the refresh if none of them changed
+            key = (int(self.currentPos * self.duration / 1000),
+                   int(self.startPos * self.duration / 1000),
+                   int(self.endPos * self.duration / 1000))
+            if key == self._lastLabelKey:
+                return
+            self._lastLabelKey = key
+
+            current, start, end = key
+            self.currentTimeLabel.setText(formatSeconds(current))
+            self.startTimeLabel.setText(formatSeconds(start))
+            self.endTimeLabel.setText(formatSeconds(end))
+
+    def scheduleTimeLabels(self):
+        if not self._labelTimer.isActive():
+            self._labelTimer.start()
 
     def getStartTime(self):
         if self.duration > 0:
@@ -638,33 +886,33 @@ class DualSlider(QWidget):
 
 
 if __name__ == "__main__":
+    # Debug diagnostics are dropped unless the level is lowered here
+    logging.basicConfig(level=logging.WARNING)
+
     path = os.getcwd()
     frameMonkey_directory = os.path.dirname(path)
 
-    print(f"Current working directory: {frameMonkey_directory}")
+    log.debug("Current working directory: %s", frameMonkey_directory)
 
-    print("Starting application...")
-    app = QApplication(sys.argv)
-    print("QApplication created")
+    log.debug("Starting application...")
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_DontUseNativeDialogs, False)
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setStyleSheet(_STYLE)
+    log.debug("QApplication created")
 
     # Process command line arguments
-    inputFile = None
-    if len(sys.argv) > 1:
+    inputFile = ""
+    if len(sys.argv) > 1 and isVideoFile(sys.argv[1]):
         inputFile = sys.argv[1]
-        if os.path.isfile(inputFile):
-            print(f"Loading file from command line: {inputFile}")
-        else:
-            inputFile = os.getcwd()
-    else:
-        inputFile = os.getcwd()
+        log.debug("Loading file from command line: %s", inputFile)
 
-    print("Creating main window...")
+    log.debug("Creating main window...")
     window = MainWindow(inputFile=inputFile)
-    print("Main window created")
+    log.debug("Main window created")
 
-    print("Showing window...")
+    log.debug("Showing window...")
     window.show()
-    print("Window shown")
+    log.debug("Window shown")
 
-    print("Starting event loop...")
+    log.debug("Starting event loop...")
     app.exec()
\ No newline at end of file
@@ -0,0 +1,118 @@
+import logging
+from collections import OrderedDict
+
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QImage
+
+log = logging.getLogger(__name__)
+
+
+class PyAvPreview(QObject):
+    """Decodes single frames with PyAV for scrubbing, QMediaPlayer is only used for playback"""
+    # Answers every request, with a null QImage when no frame could be decoded
+    frameReady = pyqtSignal(QImage)
+
+    # Recently decoded frames at display size, so dragging a marker back over a spot skips the seek
+    _frameCacheBytes = 32 * 1024 * 1024
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.container = None
+        self.stream = None
+        self.path = None
+        self._frameCache = OrderedDict()
+        self._frameCacheUsage = 0
+
+    def open(self, path):
+        self.close()
+        # Remember failed paths too, so a file PyAV cannot read is not retried on every request
+        self.path = path
+        try:
+            # PyAV is optional, without it the trim markers simply show no preview
+            import av
+        except ImportError:
+            return False
+
+        try:
+            self.container = av.open(path)
+            self.stream = self.container.streams.video[0]
+            self.stream.thread_type = "AUTO"
+        except (av.FFmpegError, IndexError) as e:
+            log.warning("Could not open preview decoder: %s", e)
+            self.close()
+            self.path = path
+            return False
+        return True
+
+    @pyqtSlot()
+    def close(self):
+        if self.container is not None:
+            self.container.close()
+        self.container = None
+        self.stream = None
+        self.path = None
+
+    @pyqtSlot(str, int, int, int)
+    def requestFrame(self, path, ms, width=0, height=0):
+        try:
+            image = self.decodeFrame(path, ms, width, height)
+        except Exception as e:
+            # Anything escaping here would leave the window waiting on a reply that never comes
+            log.warning("Preview decode failed: %s", e)
+            image = QImage()
+        self.frameReady.emit(image)
+
+    def decodeFrame(self, path, ms, width=0, height=0):
+        key = (path, ms, width, height)
+        if key in self._frameCache:
+            self._frameCache.move_to_end(key)
+            return self._frameCache[key]
+
+        image = self._decodeFrame(path, ms, width, height)
+        if not image.isNull():
+            self._cacheFrame(key, image)
+        return image
+
+    def _cacheFrame(self, key, image):
+        self._frameCache[key] = image
+        self._frameCacheUsage += image.sizeInBytes()
+        # Always keep the newest entry, even if it alone exceeds the budget
+        while len(self._frameCache) > 1 and self._frameCacheUsage > self._frameCacheBytes:
+            _, evicted = self._frameCache.popitem(last=False)
+            self._frameCacheUsage -= evicted.sizeInBytes()
+
+    def _decodeFrame(self, path, ms, width, height):
+        # The decoder is only opened once the user actually scrubs, keeping file loads fast
+        if path != self.path:
+            self.open(path)
+        if self.container is None:
+            return QImage()
+        import av
+
+        target = ms / 1000
+        frame = None
+        try:
+            # Seek lands on the keyframe before the position, decode forward to the requested frame
+            self.container.seek(int(target * av.time_base))
+            for frame in self.container.decode(self.stream):
+                if frame.time is None or frame.time >= target:
+                    break
+        except av.FFmpegError as e:
+            log.warning("Could not decode preview frame: %s", e)
+            return QImage()
+        if frame is None:
+            return QImage()
+
+        if width and height:
+            # Let libswscale fit the frame to the display area once, instead of Qt rescaling per paint
+            scale = min(width / frame.width, height / frame.height)
+            frame = frame.reformat(
+                width=max(1, int(frame.width * scale)),
+                height=max(1, int(frame.height * scale)),
+                format='rgb24'
+            )
+
+        pixels = frame.to_ndarray(format='rgb24')
+        height, width = pixels.shape[:2]
+        # Copy so the QImage owns its buffer once the ndarray is released
+        return QImage(pixels.data, width, height, pixels.strides[0], QImage.Format.Format_RGB888).copy()